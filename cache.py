@@ -0,0 +1,21 @@
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator
+
+# tts audio, summaries and guides all live under here
+CACHE_ROOT = Path.home() / ".cache" / "weft"
+
+@contextmanager
+def atomic_write(path: Path, mode: str = "wb", **kwargs) -> Iterator[IO]:
+    # write to a temp file and rename so readers never see a partial file, the temp file is removed on failure
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = tempfile.NamedTemporaryFile(mode, dir=path.parent, suffix=".part", delete=False, **kwargs)
+    try:
+        with tmp:
+            yield tmp
+        os.replace(tmp.name, path)
+    finally:
+        if os.path.exists(tmp.name):
+            os.unlink(tmp.name)
@@ -1,29 +1,224 @@
 # reader.py
+import os
+import re
+import sys
+import select
 import typer
+import hashlib
+import zipfile
+import posixpath
 import llm
 import ebooklib
 from ebooklib import epub
+from lxml import etree
+from urllib.parse import unquote
 import html2text
+import numpy as np
+import threading
+from functools import cached_property
+from collections import OrderedDict
 from rich.console import Console
 from rich.panel import Panel
 from rich.markdown import Markdown
 from rich.table import Table
+from rich.live import Live
 from readchar import readkey
 from pathlib import Path
-from tts import text_to_speech_stream
-from elevenlabs import play
+from tts import text_to_speech_pipeline, play_stream
+from cache import CACHE_ROOT, atomic_write
+
+try:
+    import termios
+except ImportError:  # windows: no typeahead draining, one key per render
+    termios = None
 
 app = typer.Typer()
 console = Console()
 
+# llm summaries and guides, keyed on a hash of model + input
+SUMMARY_CACHE_DIR = CACHE_ROOT / "summaries"
+
+# same system prompt on every turn keeps the conversation prefix byte-identical
+ASK_AI_SYSTEM = "You are an expert reading assistant analyzing a book. Keep responses clear and concise."
+
+# one keypress: an escape sequence (arrows) or a single character, a lone Esc included
+_KEY_RE = re.compile(r'\x1b\[[0-9;]*[A-Za-z~]|\x1bO[A-Za-z]|.', re.DOTALL)
+
+# input that stops partway into an escape sequence, the rest is still on its way
+_PARTIAL_KEY_RE = re.compile(rb'\x1b(\[[0-9;]*|O)?\Z')
+
+# markdown heading line
+_HEADING_RE = re.compile(r'^#+\s*(.*?)\s*$')
+
+def _html2tui() -> html2text.HTML2Text:
+    # html → markdown converter, one per conversion since it carries state between handle() calls
+    html2tui = html2text.HTML2Text()
+    html2tui.ignore_links = html2tui.ignore_images = True
+    html2tui.body_width = 0  # no hard wrapping, rich re-wraps to the console
+    html2tui.unicode_snob = True
+    html2tui.skip_internal_links = True
+    return html2tui
+
+def _convert_one(html: bytes) -> str:
+    # html → markdown for one section
+    return _html2tui().handle(html.decode('utf-8'))
+
+def _extract_title(item, content):
+    # try to get title from item
+    if hasattr(item, 'title') and item.title:
+        return item.title
+        
+    # check first 5 lines for markdown heading, only ever slicing the head of the chapter
+    head = content[:2048].lstrip()
+    for line in head.split('\n', 5)[:5]:
+        if m := _HEADING_RE.match(line):
+            return m.group(1)
+            
+    # fallback to filename
+    return Path(item.file_name).stem.replace('_', ' ').strip()
+
+def _page_ranges(estimates, height):
+    # greedy page split over per-paragraph line estimates, yielding (start, end) offsets
+    ends = np.cumsum(estimates)  # lines used up to and including each paragraph
+    start = 0
+    while start < len(estimates):
+        used = ends[start - 1] if start else 0
+        end = int(np.searchsorted(ends, used + height, side='right'))
+        # If a single paragraph is longer than page height, force split it
+        end = max(end, start + 1)
+        yield start, end
+        start = end
+
+def _cache_key(*parts: str) -> str:
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+def _load_summary(key: str) -> str | None:
+    path = SUMMARY_CACHE_DIR / f"{key}.md"
+    return path.read_text(encoding='utf-8') if path.exists() else None
+
+def _save_summary(key: str, text: str):
+    with atomic_write(SUMMARY_CACHE_DIR / f"{key}.md", 'w', encoding='utf-8') as f:
+        f.write(text)
+
+class Section:
+    """An epub document, converted to markdown the first time it's read."""
+
+    def __init__(self, item, prev: "Section | None" = None):
+        self.item, self.prev = item, prev
+        self._estimates: dict[int, np.ndarray] = {}
+        self.error: str | None = None  # why the content couldn't be converted
+
+    @cached_property
+    def content(self) -> str:
+        # often runs on the prefetch thread, so a failure is recorded for the ui rather than printed
+        try:
+            return _convert_one(self.item.get_content())
+        except Exception as e:
+            self.error = str(e)
+            return ""
+
+    @cached_property
+    def paragraphs(self) -> list[str]:
+        return self.content.split('\n\n')
+
+    @cached_property
+    def paragraph_sizes(self) -> tuple[np.ndarray, np.ndarray]:
+        # length and newline count of each paragraph, measured once per section
+        count = len(self.paragraphs)
+        lens = np.fromiter((len(p) for p in self.paragraphs), dtype=np.int32, count=count)
+        nls = np.fromiter((p.count('\n') for p in self.paragraphs), dtype=np.int32, count=count)
+        return lens, nls
+
+    def line_estimates(self, width: int) -> np.ndarray:
+        # lines each paragraph will take (including word wrap), cached per width
+        if width not in self._estimates:
+            lens, nls = self.paragraph_sizes
+            self._estimates[width] = lens // (width - 10) + nls + 2
+        return self._estimates[width]
+
+    @cached_property
+    def title(self) -> str:
+        return _extract_title(self.item, self.content)
+
+    @property
+    def parent(self) -> str | None:
+        return self.prev.title if self.prev else None
+
+OPF_NS = '{http://www.idpf.org/2007/opf}'
+DC_NS = '{http://purl.org/dc/elements/1.1/}'
+CONTAINER_NS = '{urn:oasis:names:tc:opendocument:xmlns:container}'
+
+class _LazyItem:
+    """An epub document that is only unzipped when it's read."""
+
+    def __init__(self, epub_path: str, name: str, file_name: str, file_size: int, title: str = ''):
+        self._epub_path, self._name = epub_path, name
+        self.file_name, self.file_size, self.title = file_name, file_size, title
+
+    def get_type(self):
+        return ebooklib.ITEM_DOCUMENT
+
+    def get_content(self) -> bytes:
+        # not cached, Section keeps the converted text
+        with zipfile.ZipFile(self._epub_path) as zf:
+            return zf.read(self._name)
+
+def _is_empty(item) -> bool:
+    # lazy items know their size from the zip directory, ebooklib items are already in memory
+    if isinstance(item, _LazyItem):
+        return item.file_size == 0
+    return not item.get_content()
+
+class _LazyBook:
+    """The slice of ebooklib's EpubBook the reader uses: documents and DC metadata."""
+
+    def __init__(self, items: list[_LazyItem], metadata: dict[str, list]):
+        self.items, self.metadata = items, metadata
+
+    def get_items_of_type(self, item_type):
+        return (item for item in self.items if item.get_type() == item_type)
+
+    def get_metadata(self, namespace, name):
+        return self.metadata.get(name, []) if namespace == 'DC' else []
+
+def _fast_load(epub_path: str) -> _LazyBook:
+    # read container.xml and the OPF manifest only, no other zip entry is touched up front
+    items, metadata = [], {}
+    with zipfile.ZipFile(epub_path) as zf:
+        container = etree.fromstring(zf.read('META-INF/container.xml'))
+        opf_path = container.find(f'.//{CONTAINER_NS}rootfile').get('full-path')
+        opf_dir = posixpath.dirname(opf_path)
+
+        with zf.open(opf_path) as opf:
+            for _, el in etree.iterparse(opf, events=('end',)):
+                if el.tag.startswith(DC_NS):
+                    metadata.setdefault(el.tag[len(DC_NS):], []).append((el.text, dict(el.attrib)))
+                elif el.tag == f'{OPF_NS}item' and el.get('media-type') == 'application/xhtml+xml':
+                    file_name = unquote(el.get('href'))
+                    properties = el.get('properties', '').split()
+                    title = 'Cover' if 'cover' in properties and 'nav' not in properties else ''
+                    name = posixpath.normpath(posixpath.join(opf_dir, file_name))
+                    # size comes from the zip directory, nothing is decompressed here
+                    items.append(_LazyItem(epub_path, name, file_name, zf.getinfo(name).file_size, title))
+                el.clear()
+
+    return _LazyBook(items, metadata)
+
 class Reader:
-    def __init__(self, epub_path: str):
-        self.book = epub.read_epub(epub_path)
+    PAGE_CACHE_SIZE = 64
+
+    def __init__(self, epub_path: str, fast_load: bool = False):
+        self.book = _fast_load(epub_path) if fast_load else epub.read_epub(epub_path)
         self.model = llm.get_model("gpt-4o-mini")
         self.sections = self._process_sections()
         self.current_index = self.current_page = 0
         self.pages = []
         self.metadata = self._extract_metadata()
+        self._prefetch_generation = 0
+        self._page_cache: OrderedDict[tuple, list[tuple[int, int]]] = OrderedDict()
+        self._page_cache_lock = threading.Lock()  # shared with the prefetch thread
+        self._markdown_cache: OrderedDict[tuple, Markdown] = OrderedDict()
+        self._context_cache: OrderedDict[tuple, str] = OrderedDict()
 
 
     def _extract_metadata(self):
@@ -33,44 +228,74 @@ class Reader:
         }
     
     def _process_sections(self):
-        # convert epub sections to text
-        html2tui = html2text.HTML2Text()
-        html2tui.ignore_links = html2tui.ignore_images = True
+        # wrap epub documents as sections, content is converted on first access
         sections, prev = [], None
-
-        for item in self.book.get_items():
-            if item.get_type() != ebooklib.ITEM_DOCUMENT:
+        for item in self.book.get_items_of_type(ebooklib.ITEM_DOCUMENT):
+            if _is_empty(item):
                 continue
-                
-            try:
-                if content := item.get_content():
-                    content = html2tui.handle(content.decode('utf-8'))
-                section = {
-                    'content': content,
-                    'title': self._extract_title(item, content),
-                    'parent': prev['title'] if prev else None,
-                }
-                sections.append(section)
-                prev = section
-            except Exception as e:
-                console.print(f"[yellow]Warning: Couldn't process section: {e}[/yellow]")
-        
+            prev = Section(item, prev)
+            sections.append(prev)
         return sections
+
+    def _start_prefetch(self):
+        # warm caches in the background, bumping the generation cancels older walks
+        self._prefetch_generation += 1
+        threading.Thread(
+            target=self._prefetch_neighbors,
+            args=(self._prefetch_generation, self.current_index, console.width, console.height),
+            daemon=True,
+        ).start()
+
+    def _prefetch_neighbors(self, generation: int, index: int, width: int, height: int):
+        # paginate the adjacent sections first so ←/→ are instant
+        for i in (index + 1, index - 1, index + 2, index - 2):
+            if generation != self._prefetch_generation:
+                return
+            if 0 <= i < len(self.sections):
+                self._paginate(i, width, height)
+
+        # then walk outward converting content: ±3, ±4, …
+        for offset in range(3, len(self.sections)):
+            for i in (index + offset, index - offset):
+                if generation != self._prefetch_generation:
+                    return
+                if 0 <= i < len(self.sections):
+                    self.sections[i].content
     
-    def _extract_title(self, item, content):
-        # try to get title from item
-        if hasattr(item, 'title') and item.title:
-            return item.title
-            
-        # check first 5 lines for markdown heading
-        lines = content.strip().split('\n')
-        for line in lines[:5]:  # Check first 5 lines
-            if line.startswith('#'):  # Markdown heading
-                return line.lstrip('#').strip()
-                
-        # fallback to filename
-        return Path(item.file_name).stem.replace('_', ' ').strip()
-    
+    def _paginate(self, index: int, width: int, height: int) -> list[tuple[int, int]]:
+        # page ranges for a section at a console size, recently used ones are cached
+        key = (index, width, height)
+        with self._page_cache_lock:
+            if key in self._page_cache:
+                self._page_cache.move_to_end(key)
+                return self._page_cache[key]
+
+        # ensure we have at least one page
+        ranges = list(_page_ranges(self.sections[index].line_estimates(width), height - 10)) or [(0, 0)]
+
+        with self._page_cache_lock:
+            self._page_cache[key] = ranges
+            if len(self._page_cache) > self.PAGE_CACHE_SIZE:
+                self._page_cache.popitem(last=False)
+        return ranges
+
+    def _page_content(self) -> str:
+        # text of the current page
+        start, end = self.pages[self.current_page]
+        paragraphs = self.sections[self.current_index].paragraphs
+        return '\n\n'.join(paragraphs[start:end]) or '[No content]'
+
+    def _page_markdown(self) -> Markdown:
+        # parsed markdown for the current page, reused on repeat views
+        key = (self.current_index, *self.pages[self.current_page])
+        if key in self._markdown_cache:
+            self._markdown_cache.move_to_end(key)
+        else:
+            self._markdown_cache[key] = Markdown(self._page_content())
+            if len(self._markdown_cache) > self.PAGE_CACHE_SIZE:
+                self._markdown_cache.popitem(last=False)
+        return self._markdown_cache[key]
+
     def display_current(self):
         # show current section with progress indicators
         if not self.sections:
@@ -78,40 +303,7 @@ class Reader:
             return
 
         section = self.sections[self.current_index]
-        content = section['content']
-        
-        console_height = console.height - 10
-        
-        # split content into paragraphs and group them into pages
-        paragraphs = content.split('\n\n')
-        self.pages = []
-        current_page = []
-        current_lines = 0
-        
-        for para in paragraphs:
-            # Estimate lines this paragraph will take (including word wrap)
-            para_lines = len(para) // (console.width - 10) + para.count('\n') + 2
-            
-            if current_lines + para_lines > console_height:
-                if current_page:  # Save current page if not empty
-                    self.pages.append('\n\n'.join(current_page))
-                    current_page = [para]
-                    current_lines = para_lines
-                else:  # If a single paragraph is longer than page height, force split it
-                    self.pages.append(para)
-                    current_page = []
-                    current_lines = 0
-            else:
-                current_page.append(para)
-                current_lines += para_lines
-        
-        # Add the last page if there's content
-        if current_page:
-            self.pages.append('\n\n'.join(current_page))
-        
-        # ensure we have at least one page
-        if not self.pages:
-            self.pages = ['[No content]']
+        self._load_pages()
         
         # safety check: ensure current_page is within bounds
         if self.current_page >= len(self.pages):
@@ -119,8 +311,6 @@ class Reader:
         elif self.current_page < 0:
             self.current_page = 0
         
-        page_content = self.pages[self.current_page]
-        
         # calculate progress
         overall_progress = (self.current_index / len(self.sections)) * 100
         section_progress = (self.current_page / len(self.pages)) * 100
@@ -131,7 +321,7 @@ class Reader:
         header.add_column("title", justify="left", ratio=2)
         header.add_column("progress", justify="right", ratio=1)
         header.add_row(
-            f"[bold blue]{section['title']}[/]",
+            f"[bold blue]{section.title}[/]",
             f"[yellow]Section {self.current_index + 1}/{len(self.sections)} "
             f"• Page {self.current_page + 1}/{len(self.pages)} ({section_progress:.1f}%) "
             f"• Overall {overall_progress:.1f}%[/]"
@@ -139,8 +329,10 @@ class Reader:
         
         # display progress and content
         console.print(Panel(header))
+        if section.error:
+            console.print(f"[yellow]Warning: Couldn't process section: {section.error}[/yellow]")
         console.print(Panel(
-            Markdown(page_content),
+            self._page_markdown(),
             border_style="blue"
         ))
         
@@ -152,13 +344,14 @@ class Reader:
             
         )
         console.print(Panel(nav_help))
+        self._start_prefetch()
 
     def show_toc(self):
         """Display table of contents."""
-        sections_list = ""
-        for i, section in enumerate(self.sections):
-            marker = "→" if i == self.current_index else " "
-            sections_list += f"{marker} {i+1}. {section['title']}\n"
+        sections_list = "\n".join(
+            f"{'→' if i == self.current_index else ' '} {i+1}. {section.title}"
+            for i, section in enumerate(self.sections)
+        )
         
         console.clear()
         console.print(Panel(
@@ -168,12 +361,18 @@ class Reader:
         ))
         console.input("\nPress Enter to continue...")
 
+    def _load_pages(self):
+        # page ranges for the current section, so back-to-back moves see the right page count
+        if self.sections:
+            self.pages = self._paginate(self.current_index, console.width, console.height)
+
     def navigate(self, direction: int) -> bool:
         match direction:
             case -1 | 1:  # sections ←/→
                 new_index = self.current_index + direction
                 if 0 <= new_index < len(self.sections):
                     self.current_index, self.current_page = new_index, 0
+                    self._load_pages()
                     return True
             case -2 | 2:  # pages ↑/↓
                 new_page = self.current_page + (1 if direction == 2 else -1)
@@ -184,17 +383,28 @@ class Reader:
                 new_index = self.current_index + (1 if direction == 2 else -1)
                 if 0 <= new_index < len(self.sections):
                     self.current_index = new_index
+                    self._load_pages()
                     self.current_page = 0 if direction == 2 else len(self.pages) - 1
                     return True
-            case -99: self.current_index = self.current_page = 0; return True  # start
-            case 99: self.current_index = len(self.sections)-1; self.current_page = len(self.pages)-1; return True  # end
+            case -99: self.current_index = self.current_page = 0; self._load_pages(); return True  # start
+            case 99: self.current_index = len(self.sections)-1; self._load_pages(); self.current_page = len(self.pages)-1; return True  # end
         return False
     
     # ai 
     def _get_section_context(self):
-        # get relevant context for ai from current position in book
+        # get relevant context for ai from current position in book, keyed on the page's own ranges
+        key = (self.current_index, *self.pages[self.current_page], len(self.pages))
+        if key in self._context_cache:
+            self._context_cache.move_to_end(key)
+        else:
+            self._context_cache[key] = self._build_section_context()
+            if len(self._context_cache) > self.PAGE_CACHE_SIZE:
+                self._context_cache.popitem(last=False)
+        return self._context_cache[key]
+
+    def _build_section_context(self):
         current = self.sections[self.current_index]
-        current_content = self.pages[self.current_page]
+        current_content = self._page_content()
         
         # get book metadata
         book_info = []
@@ -205,18 +415,19 @@ class Reader:
         
         # get hierarchical context
         hierarchy = []
-        if current.get('parent'):
-            hierarchy.append(f"Section: {current['parent']} > {current['title']}")
+        if current.parent:
+            hierarchy.append(f"Section: {current.parent} > {current.title}")
         else:
-            hierarchy.append(f"Section: {current['title']}")
-
-        context = f"""Book Information: {' | '.join(book_info)}
-
-                Location: {' > '.join(hierarchy)}
-                Page: {self.current_page + 1} of {len(self.pages)}
-
-                Content:
-                {current_content}"""
+            hierarchy.append(f"Section: {current.title}")
+
+        # stable book/section prefix first, the page last, so prompts share a cacheable prefix
+        context = (
+            f"Book Information: {' | '.join(book_info)}\n"
+            f"Location: {' > '.join(hierarchy)}\n"
+            f"---\n"
+            f"Page {self.current_page + 1} of {len(self.pages)}:\n"
+            f"{current_content}"
+        )
 
         return context
 
@@ -227,42 +438,59 @@ class Reader:
             response_height = available_height - content_height
             return content_height, response_height
 
-        def render_split_view(content, response_text="", question=""):
-            console.clear()
-            content_height, response_height = calculate_layout()
+        def content_panel(content):
+            content_height, _ = calculate_layout()
 
             # Format the content to fit the panel
             content_lines = content.split('\n')
             visible_content = '\n'.join(content_lines[:content_height-4])  # Leave room for panel borders
 
             # Content panel - show as much as fits in the allocated height
-            console.print(Panel(
+            return Panel(
                 Markdown(visible_content),
                 title="[blue]Current Text[/]",
                 border_style="blue",
                 height=content_height,
                 expand=True
-            ))
+            )
 
-            # Response panel
-            console.print(Panel(
+        def response_panel(response_text="", question=""):
+            _, response_height = calculate_layout()
+            return Panel(
                 Markdown(response_text) if response_text else "[dim]Waiting for response...[/dim]",
                 title=f"[green]AI Response{f' to: {question}' if question else ''}[/]",
                 border_style="green",
                 height=response_height,
                 expand=True
-            ))
+            )
+
+        def render_split_view(content, response_text="", question=""):
+            console.clear()
+            console.print(content_panel(content))
+            console.print(response_panel(response_text, question))
 
         def stream_response(conversation, question, content):
-            text = ""
-            with console.status("[bold green]Thinking...[/]"):
-                for chunk in conversation.prompt(f"Based on this text:\n{content}\n\nQuestion: {question}"):
+            # the page goes out with the first question, follow-ups ride on the conversation history
+            if conversation.responses:
+                prompt = f"Question: {question}"
+            else:
+                prompt = f"Based on this text:\n{content}\n---\nQuestion: {question}"
+
+            # content stays put, only the response panel is redrawn while streaming
+            console.clear()
+            console.print(content_panel(content))
+            text, rendered = "", 0
+            with Live(response_panel(question=question), console=console, refresh_per_second=15) as live:
+                for chunk in conversation.prompt(prompt, system=ASK_AI_SYSTEM):
                     text += chunk
-                    render_split_view(content, text, question)
+                    # re-parse markdown every ~80 chars or at a line break, not per token
+                    if len(text) - rendered > 80 or '\n' in chunk:
+                        live.update(response_panel(text, question))
+                        rendered = len(text)
+                live.update(response_panel(text, question))
             return text
 
         conversation = self.model.conversation()
-        conversation.system = "You are an expert reading assistant analyzing a book. Keep responses clear and concise."
         content = self._get_section_context()
 
         while True:
@@ -297,36 +525,45 @@ class Reader:
             summary_height = available_height - content_height
             return content_height, summary_height
 
-        def render_split_view(content, summary_text=""):
-            console.clear()
-            content_height, summary_height = calculate_layout()
-
-            # Content panel
-            console.print(Panel(
+        def content_panel(content):
+            content_height, _ = calculate_layout()
+            return Panel(
                 Markdown(content),
                 title="[blue]Current Text[/]",
                 border_style="blue",
                 height=content_height
-            ))
+            )
 
-            # Summary panel
-            console.print(Panel(
+        def summary_panel(summary_text=""):
+            _, summary_height = calculate_layout()
+            return Panel(
                 summary_text or "[dim]Generating summary...[/dim]",
                 title="[green]Content Summary[/]",
                 border_style="green",
                 height=summary_height
-            ))
+            )
 
         def stream_summary():
-            current_content = self.pages[self.current_page]
+            current_content = self._page_content()
+            key = _cache_key(self.model.model_id, current_content)
+            if (summary := _load_summary(key)) is not None:
+                console.clear()
+                console.print(content_panel(current_content))
+                console.print(summary_panel(summary))
+                return summary
+
             summary = ""
-            
-            with console.status("[bold green]Thinking...[/]"):
+
+            # content stays put, only the summary panel is redrawn while streaming
+            console.clear()
+            console.print(content_panel(current_content))
+            with Live(summary_panel(), console=console, refresh_per_second=15) as live:
                 response = self.model.prompt(create_prompt(current_content))
                 for chunk in response:
                     summary += chunk
-                    render_split_view(current_content, summary)
-            
+                    live.update(summary_panel(summary))
+
+            _save_summary(key, summary)
             return summary
 
         try:
@@ -343,12 +580,9 @@ class Reader:
             return
 
         try:
-            content = self.pages[self.current_page]
-            with console.status("[bold green]Converting text to speech...[/]"):
-                audio = text_to_speech_stream(content)
-            
+            content = self._page_content()
             with console.status("[bold green]Reading aloud... (Press Ctrl+C to stop)[/]"):
-                play(audio)
+                play_stream(text_to_speech_pipeline(content))
                 
         except KeyboardInterrupt:
             console.print("\n[yellow]Stopped reading.[/yellow]")
@@ -370,11 +604,14 @@ class Reader:
             Context:
             {self._get_section_context()}"""
             
-            with console.status("[bold green]Creating guide...[/]"):
-                response = "".join(chunk for chunk in self.model.prompt(prompt))
+            key = _cache_key(self.model.model_id, prompt)
+            if (response := _load_summary(key)) is None:
+                with console.status("[bold green]Creating guide...[/]"):
+                    response = "".join(chunk for chunk in self.model.prompt(prompt))
+                _save_summary(key, response)
                 
             with console.status("[bold green]Reading guide... (Ctrl+C to stop)[/]"):
-                play(text_to_speech_stream(response))
+                play_stream(text_to_speech_pipeline(response))
                 
         except KeyboardInterrupt:
             console.print("\n[yellow]Stopped reading.[/yellow]")
@@ -383,30 +620,58 @@ class Reader:
         finally:
             console.input("\nPress Enter to continue...")
 
+def _read_keys() -> list[str]:
+    # block for one key, then drain anything already typed ahead
+    if termios is None or not sys.stdin.isatty():
+        return [readkey()]
+
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    term = termios.tcgetattr(fd)
+    term[3] &= ~(termios.ICANON | termios.ECHO)
+    try:
+        # TCSANOW, unlike readkey's TCSAFLUSH, keeps keys pressed while we were rendering
+        termios.tcsetattr(fd, termios.TCSANOW, term)
+        data = os.read(fd, 1024)
+        while select.select([fd], [], [], 0)[0]:
+            data += os.read(fd, 1024)
+        # give an escape sequence cut off by the read up to 50ms to finish, readkey blocked for it
+        while _PARTIAL_KEY_RE.search(data) and select.select([fd], [], [], 0.05)[0]:
+            data += os.read(fd, 1024)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+    return _KEY_RE.findall(data.decode(errors='ignore'))
+
 @app.command()
-def read(epub_path: str = typer.Argument(..., help="Path to EPUB file")):
+def read(
+    epub_path: str = typer.Argument(..., help="Path to EPUB file"),
+    fast_load: bool = typer.Option(False, "--fast-load", help="Only unzip documents, and only when read"),
+):
     """Interactive ebook reader with AI assistance."""
     if not Path(epub_path).exists() or not epub_path.endswith('.epub'):
         console.print("[red]Please provide a valid EPUB file[/red]")
         raise typer.Exit(1)
 
     try:
-        reader = Reader(epub_path)
+        reader = Reader(epub_path, fast_load=fast_load)
         while True:
             reader.display_current()
-            match readkey():
-                case 'q': break
-                case 'h' | '\x1b[D': reader.navigate(-1)  # h/← for prev section
-                case 'l' | '\x1b[C': reader.navigate(1)   # l/→ for next section
-                case 'j' | '\x1b[B': reader.navigate(2)   # j/↓ for next page
-                case 'k' | '\x1b[A': reader.navigate(-2)  # k/↑ for prev page
-                case 'g': reader.navigate(-99)  # g for start
-                case 'G': reader.navigate(99)   # G for end
-                case 'a': reader.ask_ai()
-                case 's': reader.summarize_current()
-                case 't': reader.show_toc()
-                case 'r': reader.read_aloud()
-                case '>': reader.read_compass()
+            # a burst of keys (e.g. holding j) is applied in order, then rendered once;
+            # keys after one that opens a screen are dropped, like readkey's flush did
+            for key in _read_keys():
+                match key:
+                    case 'q': return
+                    case 'h' | '\x1b[D': reader.navigate(-1)  # h/← for prev section
+                    case 'l' | '\x1b[C': reader.navigate(1)   # l/→ for next section
+                    case 'j' | '\x1b[B': reader.navigate(2)   # j/↓ for next page
+                    case 'k' | '\x1b[A': reader.navigate(-2)  # k/↑ for prev page
+                    case 'g': reader.navigate(-99)  # g for start
+                    case 'G': reader.navigate(99)   # G for end
+                    case 'a': reader.ask_ai(); break
+                    case 's': reader.summarize_current(); break
+                    case 't': reader.show_toc(); break
+                    case 'r': reader.read_aloud(); break
+                    case '>': reader.read_compass(); break
     except KeyboardInterrupt:
         console.print("\n[yellow]Reader closed.[/yellow]")
 
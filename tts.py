@@ -1,33 +1,127 @@
 import os
+import re
 import dotenv
-from io import BytesIO
-from elevenlabs import play, VoiceSettings
+import queue
+import hashlib
+import threading
+import subprocess
+from typing import Iterable, Iterator
+from pathlib import Path
+from elevenlabs import VoiceSettings
 from elevenlabs.client import ElevenLabs
+from cache import CACHE_ROOT, atomic_write
 
 dotenv.load_dotenv()
 
 client = ElevenLabs(api_key=os.getenv("ELEVENLABS_API_KEY"))
 
-def text_to_speech_stream(text: str) -> BytesIO:
-    audio = BytesIO()
+VOICE_ID = "pNInz6obpgDQGcFmaJgB"  # Adam pre-made voice
+MODEL_ID = "eleven_multilingual_v2"
+VOICE_SETTINGS = VoiceSettings(
+    stability=0.0,
+    similarity_boost=1.0,
+    style=0.0,
+    use_speaker_boost=True,
+)
+CACHE_DIR = CACHE_ROOT / "tts"
+
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
+def _cache_path(text: str) -> Path:
+    # content-addressed: same text and voice params → same file
+    key = hashlib.sha256(
+        f"{text}{VOICE_ID}{MODEL_ID}{VOICE_SETTINGS.json()}".encode()
+    ).hexdigest()
+    return CACHE_DIR / f"{key}.mp3"
+
+def text_to_speech_chunks(text: str) -> Iterator[bytes]:
+    # yield mp3 chunks as they arrive, cached audio comes back in one piece
+    path = _cache_path(text)
+    if path.exists():
+        yield path.read_bytes()
+        return
+
     # tts conversion
     response = client.text_to_speech.convert(
         text=text,
-        voice_id="pNInz6obpgDQGcFmaJgB",  # Adam pre-made voice
-        model_id="eleven_multilingual_v2",
-        voice_settings=VoiceSettings(
-            stability=0.0,
-            similarity_boost=1.0,
-            style=0.0,
-            use_speaker_boost=True,
-        ),
+        voice_id=VOICE_ID,
+        model_id=MODEL_ID,
+        voice_settings=VOICE_SETTINGS,
     )
 
-    for chunk in response:
-        audio.write(chunk)
-    audio.seek(0)
-    return audio
+    # a download cut short is never cached
+    with atomic_write(path) as f:
+        for chunk in response:
+            f.write(chunk)
+            yield chunk
+
+def _split_sentences(text: str, max_len: int = 500) -> list[str]:
+    # pack whole sentences into chunks of up to max_len chars
+    chunks, current = [], ""
+    for sentence in _SENTENCE_END.split(text.strip()):
+        if current and len(current) + len(sentence) + 1 > max_len:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+def text_to_speech_pipeline(text: str) -> Iterator[bytes]:
+    # stream the first chunk as it's synthesized, the rest are prepared at most two ahead
+    first, *rest = _split_sentences(text) or [""]
+    segments = queue.Queue(maxsize=2)
+    stopped = threading.Event()
+
+    def put(item) -> bool:
+        # False once the player has gone away
+        while not stopped.is_set():
+            try:
+                segments.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for chunk in rest:
+                if not put(b"".join(text_to_speech_chunks(chunk))):
+                    return
+            put(None)
+        except Exception as e:
+            put(e)  # re-raised on the playing side
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        if first:
+            yield from text_to_speech_chunks(first)
+        while (item := segments.get()) is not None:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stopped.set()
+
+def play_stream(chunks: Iterable[bytes]) -> None:
+    # pipe audio into ffplay as it arrives so playback starts on the first chunk
+    proc = subprocess.Popen(
+        ["ffplay", "-autoexit", "-nodisp", "-loglevel", "quiet", "-"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        for chunk in chunks:
+            proc.stdin.write(chunk)
+            proc.stdin.flush()  # hand each chunk to ffplay as soon as it's written
+        proc.stdin.close()
+        proc.wait()
+    finally:
+        if proc.poll() is None:  # interrupted mid-playback
+            proc.kill()
 
 # testing
 if __name__ == "__main__":
-    play(text_to_speech_stream("heya just testing out the elevenlabs api"))
\ No newline at end of file
+    play_stream(text_to_speech_pipeline("heya just testing out the elevenlabs api"))